@@ -9,6 +9,7 @@
 #include "numerical/math/CompilerOptimizations.hpp"
 #include "numerical/math/ComplexNumber.hpp"
 #include "numerical/math/Math.hpp"
+#include <array>
 #include <numbers>
 
 namespace analysis
@@ -33,6 +34,8 @@ namespace analysis
         typename infra::BoundedVector<QNumberType>::template WithMaxSize<Length> output;
         typename infra::BoundedVector<QNumberType>::template WithMaxSize<Length> reordered;
         typename VectorComplex::template WithMaxSize<Length> complexBuffer;
+        std::array<float, Length> cosine{};
+        std::array<float, Length> sine{};
     };
 
     // Implementation //
@@ -44,6 +47,13 @@ namespace analysis
         output.resize(Length);
         reordered.resize(Length);
         complexBuffer.resize(Length);
+
+        for (std::size_t k = 0; k < Length; ++k)
+        {
+            auto rotation = math::SinCos(static_cast<float>(k) * std::numbers::pi_v<float> / (2.0f * static_cast<float>(Length)));
+            cosine[k] = rotation.cos;
+            sine[k] = rotation.sin;
+        }
     }
 
     template<typename QNumberType, std::size_t Length>
@@ -59,39 +69,38 @@ namespace analysis
 
         auto& fftResult = fft.Forward(reordered);
 
-        output[0] = QNumberType(math::ToFloat(fftResult[0].Real()) / math::Sqrt(static_cast<float>(Length)));
+        float sqrtN = math::Sqrt(static_cast<float>(Length));
+        float scale = 2.0f / sqrtN;
+
+        output[0] = QNumberType(math::ToFloat(fftResult[0].Real()) / sqrtN);
 
         for (std::size_t k = 1; k < Length; ++k)
         {
-            float angle = -static_cast<float>(k) * std::numbers::pi_v<float> / (2.0f * Length);
-            float scale = 2.0f / math::Sqrt(static_cast<float>(Length));
-
             float real = math::ToFloat(fftResult[k].Real());
             float imag = math::ToFloat(fftResult[k].Imaginary());
 
-            output[k] = QNumberType((real * math::Cos(angle) - imag * math::Sin(angle)) * scale);
+            output[k] = QNumberType((real * cosine[k] + imag * sine[k]) * scale);
         }
 
         return output;
     }
 
     template<typename QNumberType, std::size_t Length>
-    typename DiscreteConsineTransform<QNumberType, Length>::VectorReal& DiscreteConsineTransform<QNumberType, Length>::Inverse(VectorReal& input)
+    OPTIMIZE_FOR_SPEED
+        typename DiscreteConsineTransform<QNumberType, Length>::VectorReal&
+        DiscreteConsineTransform<QNumberType, Length>::Inverse(VectorReal& input)
     {
         float sqrtN = math::Sqrt(static_cast<float>(Length));
+        float halfSqrtN = sqrtN / 2.0f;
 
         complexBuffer[0] = math::Complex<QNumberType>{ QNumberType(math::ToFloat(input[0]) * sqrtN), QNumberType(0.0f) };
 
         for (std::size_t k = 1; k < Length; ++k)
         {
-            float real = math::ToFloat(input[k]) * sqrtN / 2.0f;
-            float imag = -math::ToFloat(input[Length - k]) * sqrtN / 2.0f;
-
-            float angle = static_cast<float>(k) * std::numbers::pi_v<float> / (2.0f * static_cast<float>(Length));
-            float cosine = math::Cos(angle);
-            float sine = math::Sin(angle);
+            float real = math::ToFloat(input[k]) * halfSqrtN;
+            float imag = -math::ToFloat(input[Length - k]) * halfSqrtN;
 
-            complexBuffer[k] = math::Complex<QNumberType>{ QNumberType(real * cosine - imag * sine), QNumberType(real * sine + imag * cosine) };
+            complexBuffer[k] = math::Complex<QNumberType>{ QNumberType(real * cosine[k] - imag * sine[k]), QNumberType(real * sine[k] + imag * cosine[k]) };
         }
 
         auto& timeDomain = fft.Inverse(complexBuffer);
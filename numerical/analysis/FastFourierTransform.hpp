@@ -20,7 +20,7 @@ namespace analysis
             "FastFourierTransform can only be instantiated with math::QNumber types.");
 
     public:
-        constexpr std::size_t Log2(std::size_t n)
+        static constexpr std::size_t Log2(std::size_t n)
         {
             return (n <= 1) ? 0 : 1 + Log2(n >> 1);
         }
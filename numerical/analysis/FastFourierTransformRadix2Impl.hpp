@@ -34,9 +34,10 @@ namespace analysis
         void Calculate();
 
     private:
-        const std::size_t log2_n = FastFourierTransform<QNumberType>::Log2(Length);
-        const std::size_t radix = 2;
-        const std::size_t radixBits = FastFourierTransform<QNumberType>::Log2(radix);
+        static constexpr std::size_t log2_n = FastFourierTransform<QNumberType>::Log2(Length);
+        static constexpr std::size_t radix = 2;
+        static constexpr std::size_t radixBits = FastFourierTransform<QNumberType>::Log2(radix);
+        static constexpr float inverseLength = 1.0f / static_cast<float>(Length);
         TwiddleFactors<QNumberType, Length / 2>& twiddleFactors;
         typename infra::BoundedVector<math::Complex<QNumberType>>::template WithMaxSize<Length> frequencyDomain;
         typename infra::BoundedVector<QNumberType>::template WithMaxSize<Length> timeDomain;
@@ -61,25 +62,23 @@ namespace analysis
     template<typename QNumberType, std::size_t Length>
     OPTIMIZE_FOR_SPEED void FastFourierTransformRadix2Impl<QNumberType, Length>::Calculate()
     {
-        for (auto step = 2; step <= Length; step *= 2)
+        for (std::size_t step = 2; step <= Length; step *= 2)
         {
             auto halfStep = step / 2;
             auto stepFactor = Length / step;
 
-            for (size_t i = 0; i < Length; i += step)
+            for (size_t k = 0; k < halfStep; ++k)
             {
-                auto k = 0;
-                for (size_t j = i; j < i + halfStep; ++j)
+                math::Complex twiddle = twiddleFactors[k * stepFactor];
+
+                for (size_t j = k; j < Length; j += step)
                 {
                     math::Complex<QNumberType>& a = frequencyDomain[j];
                     math::Complex<QNumberType>& b = frequencyDomain[j + halfStep];
-                    math::Complex twiddle = twiddleFactors[k * stepFactor];
 
                     math::Complex temp = b * twiddle;
                     b = (a - temp);
                     a = (a + temp);
-
-                    k++;
                 }
             }
         }
@@ -118,7 +117,7 @@ namespace analysis
         ResetTimeDomain();
 
         for (std::size_t i = 0; i < frequencyDomain.size(); i++)
-            timeDomain[i] = (QNumberType(math::ToFloat(frequencyDomain[i].Real()) / static_cast<float>(Length)));
+            timeDomain[i] = (QNumberType(math::ToFloat(frequencyDomain[i].Real()) * inverseLength));
 
         return timeDomain;
     }
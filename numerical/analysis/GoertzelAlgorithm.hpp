@@ -31,9 +31,14 @@ namespace analysis
         static T Coefficient(std::size_t k, std::size_t blockLength);
 
     private:
-        T coeff;
+        GoertzelAlgorithm(math::SinCosResult<T> rotation, std::size_t blockLength);
+
+        static T Omega(std::size_t k, std::size_t blockLength);
+
+    private:
         T cosine;
         T sine;
+        T coeff;
         std::size_t blockSize;
         T s1{ T{ 0 } };
         T s2{ T{ 0 } };
@@ -42,9 +47,14 @@ namespace analysis
 
     template<typename T>
     GoertzelAlgorithm<T>::GoertzelAlgorithm(std::size_t k, std::size_t blockLength)
-        : coeff{ T{ 2 } * math::Cos(T{ 2 } * std::numbers::pi_v<T> * static_cast<T>(k) / static_cast<T>(blockLength)) }
-        , cosine{ math::Cos(T{ 2 } * std::numbers::pi_v<T> * static_cast<T>(k) / static_cast<T>(blockLength)) }
-        , sine{ math::Sin(T{ 2 } * std::numbers::pi_v<T> * static_cast<T>(k) / static_cast<T>(blockLength)) }
+        : GoertzelAlgorithm(math::SinCos(Omega(k, blockLength)), blockLength)
+    {}
+
+    template<typename T>
+    GoertzelAlgorithm<T>::GoertzelAlgorithm(math::SinCosResult<T> rotation, std::size_t blockLength)
+        : cosine{ rotation.cos }
+        , sine{ rotation.sin }
+        , coeff{ T{ 2 } * cosine }
         , blockSize{ blockLength }
     {}
 
@@ -96,7 +106,13 @@ namespace analysis
     template<typename T>
     T GoertzelAlgorithm<T>::Coefficient(std::size_t k, std::size_t blockLength)
     {
-        return T{ 2 } * math::Cos(T{ 2 } * std::numbers::pi_v<T> * static_cast<T>(k) / static_cast<T>(blockLength));
+        return T{ 2 } * math::Cos(Omega(k, blockLength));
+    }
+
+    template<typename T>
+    T GoertzelAlgorithm<T>::Omega(std::size_t k, std::size_t blockLength)
+    {
+        return T{ 2 } * std::numbers::pi_v<T> * static_cast<T>(k) / static_cast<T>(blockLength);
     }
 }
 
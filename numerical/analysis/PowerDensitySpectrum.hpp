@@ -9,6 +9,7 @@
 #include "numerical/math/CompilerOptimizations.hpp"
 #include "numerical/math/ComplexNumber.hpp"
 #include "numerical/math/QNumber.hpp"
+#include <array>
 
 #ifdef NUMERICAL_TOOLBOX_COVERAGE_BUILD
 #include "numerical/analysis/test/PowerDensitySpectrumTestSupport.hpp"
@@ -43,12 +44,13 @@ namespace analysis
     private:
         QNumberType MagnitudeSquared(const math::Complex<QNumberType>& data) const;
         void ResetOutput();
-        void ResetSegment();
 
     private:
         static constexpr std::size_t overlapSize = (SegmentSize * Overlap) / 100;
         static constexpr std::size_t step = SegmentSize - overlapSize;
-        windowing::Window<QNumberType>& window;
+        static constexpr float inverseSegmentSize = 1.0f / static_cast<float>(SegmentSize);
+        std::array<QNumberType, SegmentSize> windowCoefficients;
+        float windowPower;
         QNumberType samplingTimeInSeconds;
         TwiddleFactor twiddleFactors;
         Fft fft{ twiddleFactors };
@@ -61,9 +63,14 @@ namespace analysis
     template<typename QNumberType, std::size_t SegmentSize, typename Fft, typename TwiddleFactor, std::size_t Overlap>
     PowerSpectralDensity<QNumberType, SegmentSize, Fft, TwiddleFactor, Overlap>::PowerSpectralDensity(
         windowing::Window<QNumberType>& window, QNumberType samplingTimeInSeconds)
-        : window(window)
+        : windowPower(math::ToFloat(window.Power(SegmentSize)))
         , samplingTimeInSeconds(samplingTimeInSeconds)
-    {}
+    {
+        for (std::size_t j = 0; j < SegmentSize; ++j)
+            windowCoefficients[j] = window(j, SegmentSize);
+
+        segment.resize(SegmentSize);
+    }
 
     template<typename QNumberType, std::size_t SegmentSize, typename Fft, typename TwiddleFactor, std::size_t Overlap>
     OPTIMIZE_FOR_SPEED typename PowerSpectralDensity<QNumberType, SegmentSize, Fft, TwiddleFactor, Overlap>::VectorReal&
@@ -77,21 +84,19 @@ namespace analysis
 
         for (std::size_t i = 0; i + SegmentSize <= input.size(); i += step)
         {
-            ResetSegment();
-
             for (std::size_t j = 0; j < SegmentSize; ++j)
-                segment[j] = QNumberType(input[i + j] * window(j, SegmentSize));
+                segment[j] = QNumberType(input[i + j] * windowCoefficients[j]);
 
             auto& spectrum = fft.Forward(segment);
 
             for (std::size_t k = 0; k <= SegmentSize / 2; ++k)
-                y[k] += QNumberType(math::ToFloat(MagnitudeSquared(spectrum[k])) / static_cast<float>(SegmentSize));
+                y[k] += QNumberType(math::ToFloat(MagnitudeSquared(spectrum[k])) * inverseSegmentSize);
 
             ++segmentCount;
         }
 
         float normalization = math::ToFloat(samplingTimeInSeconds) /
-                              (math::ToFloat(window.Power(SegmentSize)) * static_cast<float>(segmentCount));
+                              (windowPower * static_cast<float>(segmentCount));
 
         for (std::size_t i = 0; i < y.size(); ++i)
             y[i] = QNumberType(math::ToFloat(y[i]) * normalization);
@@ -113,13 +118,6 @@ namespace analysis
         y.resize(SegmentSize / 2 + 1);
     }
 
-    template<typename QNumberType, std::size_t SegmentSize, typename Fft, typename TwiddleFactor, std::size_t Overlap>
-    void PowerSpectralDensity<QNumberType, SegmentSize, Fft, TwiddleFactor, Overlap>::ResetSegment()
-    {
-        segment.clear();
-        segment.resize(SegmentSize);
-    }
-
 #ifdef NUMERICAL_TOOLBOX_COVERAGE_BUILD
     extern template class PowerSpectralDensity<float, 512, test::FftStub<float, 512>, test::TwiddleFactorsStub<float, 256>, 50>;
     extern template class PowerSpectralDensity<float, 512, test::FftStub<float, 512>, test::TwiddleFactorsStub<float, 256>, 0>;
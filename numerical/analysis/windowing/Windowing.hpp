@@ -6,6 +6,7 @@
 
 #include "numerical/math/Math.hpp"
 #include "numerical/math/QNumber.hpp"
+#include <numbers>
 
 namespace windowing
 {
@@ -29,7 +30,7 @@ namespace windowing
     public:
         QNumberType operator()(std::size_t n, std::size_t order) override
         {
-            return QNumberType((0.54f - 0.46f * static_cast<float>(math::Cos(2.0 * math::pi * static_cast<double>(n) / static_cast<double>(order)))) * 0.9999f);
+            return QNumberType((0.54f - 0.46f * math::Cos(2.0f * std::numbers::pi_v<float> * static_cast<float>(n) / static_cast<float>(order))) * 0.9999f);
         }
 
         QNumberType Power([[maybe_unused]] std::size_t order) override
@@ -45,7 +46,7 @@ namespace windowing
     public:
         QNumberType operator()(std::size_t n, std::size_t order) override
         {
-            return QNumberType(0.5f * (1.0f - static_cast<float>(math::Cos(2.0 * math::pi * static_cast<double>(n) / static_cast<double>(order)))) * 0.9999f);
+            return QNumberType(0.5f * (1.0f - math::Cos(2.0f * std::numbers::pi_v<float> * static_cast<float>(n) / static_cast<float>(order))) * 0.9999f);
         }
 
         QNumberType Power([[maybe_unused]] std::size_t order) override
@@ -61,8 +62,10 @@ namespace windowing
     public:
         QNumberType operator()(std::size_t n, std::size_t order) override
         {
-            return QNumberType(
-                (0.42f - 0.5f * static_cast<float>(math::Cos(2.0 * math::pi * static_cast<double>(n) / static_cast<double>(order))) + 0.08f * static_cast<float>(math::Cos(4.0 * math::pi * static_cast<double>(n) / static_cast<double>(order)))) * 0.9999f);
+            auto cosine = math::Cos(2.0f * std::numbers::pi_v<float> * static_cast<float>(n) / static_cast<float>(order));
+            auto cosineDoubleAngle = 2.0f * cosine * cosine - 1.0f;
+
+            return QNumberType((0.42f - 0.5f * cosine + 0.08f * cosineDoubleAngle) * 0.9999f);
         }
 
         QNumberType Power([[maybe_unused]] std::size_t order) override
@@ -6,11 +6,12 @@
 
 #include "infra/util/ReallyAssert.hpp"
 #include "numerical/math/CompilerOptimizations.hpp"
+#include <cstdint>
 #include <type_traits>
 
 namespace controllers
 {
-    enum class RelayState
+    enum class RelayState : uint8_t
     {
         Low,
         High
@@ -49,9 +50,9 @@ namespace controllers
     template<typename T>
     OPTIMIZE_FOR_SPEED T BangBangHysteresis<T>::Update(T measurement)
     {
-        if (state == RelayState::Low && measurement >= highThreshold)
+        if (measurement >= highThreshold)
             state = RelayState::High;
-        else if (state == RelayState::High && measurement <= lowThreshold)
+        else if (measurement <= lowThreshold)
             state = RelayState::Low;
 
         return (state == RelayState::High) ? outputHigh : outputLow;
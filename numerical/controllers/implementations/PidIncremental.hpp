@@ -36,7 +36,6 @@ namespace controllers
         QNumberType a2 = 0;
 
         QNumberType u = QNumberType(0.0f);
-        QNumberType u_1 = QNumberType(0.0f);
 
         QNumberType e = QNumberType(0.0f);
         QNumberType e_1 = QNumberType(0.0f);
@@ -44,7 +43,7 @@ namespace controllers
     };
 
     template<typename QNumberType>
-    class PidIncrementalAsynchronous
+    class PidIncrementalAsynchronous final
         : public AsynchronousPidController<QNumberType>
         , private PidIncrementalBase<QNumberType>
     {
@@ -64,7 +63,7 @@ namespace controllers
     };
 
     template<typename QNumberType>
-    class PidIncrementalSynchronous
+    class PidIncrementalSynchronous final
         : public SynchronousPidController<QNumberType>
         , private PidIncrementalBase<QNumberType>
     {
@@ -103,7 +102,6 @@ namespace controllers
     void PidIncrementalBase<QNumberType>::Enable()
     {
         u = QNumberType(0.0f);
-        u_1 = QNumberType(0.0f);
 
         e = QNumberType(0.0f);
         e_1 = QNumberType(0.0f);
@@ -154,11 +152,10 @@ namespace controllers
         if (!hasSetPoint) [[unlikely]]
             return processVariable;
 
-        u_1 = u;
         e_2 = e_1;
         e_1 = e;
         e = setPointValue - processVariable;
-        u = Clamp(u_1 + a0 * e + a1 * e_1 + a2 * e_2);
+        u = Clamp(u + a0 * e + a1 * e_1 + a2 * e_2);
 
         return u;
     }
@@ -39,8 +39,7 @@ namespace controllers
 
     public:
         RateLimiter(T maxRate, T sampleTime)
-            : maxRate{ maxRate }
-            , sampleTime{ sampleTime }
+            : step{ maxRate * sampleTime }
         {
         }
 
@@ -53,7 +52,6 @@ namespace controllers
                 return u;
             }
 
-            T step{ maxRate * sampleTime };
             T delta{ std::min(std::max(u - previous, -step), step) };
             previous = previous + delta;
             return previous;
@@ -66,8 +64,7 @@ namespace controllers
         }
 
     private:
-        T maxRate;
-        T sampleTime;
+        T step;
         T previous{};
         bool primed{ false };
     };
@@ -95,14 +95,20 @@ namespace filters
     template<typename T, AhrsMode M>
     math::Vector3<T> AhrsFilter<T, M>::NorthFromQuaternion(const math::Quaternion<T>& quat, T bx, T bz)
     {
+        T bx2{ T(2) * bx };
+        T bz2{ T(2) * bz };
         T qw{ quat.w };
         T qx{ quat.x };
         T qy{ quat.y };
         T qz{ quat.z };
+        T xx{ qx * qx };
+        T yy{ qy * qy };
+        T xz{ qx * qz };
+        T wy{ qw * qy };
         return math::Vector3<T>{
-            { bx * (T(1) - T(2) * (qy * qy + qz * qz)) + bz * T(2) * (qx * qz - qw * qy) },
-            { bx * T(2) * (qx * qy - qw * qz) + bz * T(2) * (qw * qx + qy * qz) },
-            { bx * T(2) * (qw * qy + qx * qz) + bz * (T(1) - T(2) * (qx * qx + qy * qy)) }
+            { bx - bx2 * (yy + qz * qz) + bz2 * (xz - wy) },
+            { bx2 * (qx * qy - qw * qz) + bz2 * (qw * qx + qy * qz) },
+            { bx2 * (wy + xz) + bz - bz2 * (xx + yy) }
         };
     }
 
@@ -137,13 +143,11 @@ namespace filters
         T qx{ quat.x };
         T qy{ quat.y };
         T qz{ quat.z };
-        T mx{ m.at(0, 0) };
-        T my{ m.at(1, 0) };
-        T mz{ m.at(2, 0) };
+        math::Vector3<T> north{ NorthFromQuaternion(quat, bx, bz) };
 
-        T f4{ bx * (T(1) - T(2) * (qy * qy + qz * qz)) + bz * T(2) * (qx * qz - qw * qy) - mx };
-        T f5{ bx * T(2) * (qx * qy - qw * qz) + bz * T(2) * (qw * qx + qy * qz) - my };
-        T f6{ bx * T(2) * (qw * qy + qx * qz) + bz * (T(1) - T(2) * (qx * qx + qy * qy)) - mz };
+        T f4{ north.at(0, 0) - m.at(0, 0) };
+        T f5{ north.at(1, 0) - m.at(1, 0) };
+        T f6{ north.at(2, 0) - m.at(2, 0) };
 
         T gw{ -T(2) * bz * qy * f4 + (-T(2) * bx * qz + T(2) * bz * qx) * f5 + T(2) * bx * qy * f6 };
         T gx{ T(2) * bz * qz * f4 + (T(2) * bx * qy + T(2) * bz * qw) * f5 + (T(2) * bx * qz - T(2) * bz * qw) * f6 };
@@ -4,11 +4,13 @@
 #pragma GCC optimize("O3", "fast-math")
 #endif
 
+#include "infra/util/ReallyAssert.hpp"
 #include "numerical/math/CompilerOptimizations.hpp"
 #include "numerical/math/Math.hpp"
 #include <array>
 #include <cstddef>
 #include <numbers>
+#include <span>
 #include <type_traits>
 
 namespace filters::passive
@@ -34,6 +36,7 @@ namespace filters::passive
         explicit Biquad(BiquadCoeffs<T> coeffs) noexcept;
 
         OPTIMIZE_FOR_SPEED T Filter(T x) noexcept;
+        OPTIMIZE_FOR_SPEED void Filter(std::span<const T> input, std::span<T> output) noexcept;
         void Reset() noexcept;
 
         static BiquadCoeffs<T> LowPass(T fc, T fs, T Q) noexcept;
@@ -58,6 +61,7 @@ namespace filters::passive
         explicit BiquadCascade(std::array<BiquadCoeffs<T>, Sections> coeffs) noexcept;
 
         OPTIMIZE_FOR_SPEED T Filter(T x) noexcept;
+        OPTIMIZE_FOR_SPEED void Filter(std::span<const T> input, std::span<T> output) noexcept;
         void Reset() noexcept;
 
     private:
@@ -80,6 +84,28 @@ namespace filters::passive
         return y;
     }
 
+    template<typename T>
+    OPTIMIZE_FOR_SPEED void Biquad<T>::Filter(std::span<const T> input, std::span<T> output) noexcept
+    {
+        really_assert(output.size() >= input.size());
+
+        const BiquadCoeffs<T> k{ c };
+        T s1{ z1 };
+        T s2{ z2 };
+
+        for (std::size_t n = 0; n < input.size(); ++n)
+        {
+            const T x{ input[n] };
+            const T y{ k.b0 * x + s1 };
+            s1 = k.b1 * x - k.a1 * y + s2;
+            s2 = k.b2 * x - k.a2 * y;
+            output[n] = y;
+        }
+
+        z1 = s1;
+        z2 = s2;
+    }
+
     template<typename T>
     void Biquad<T>::Reset() noexcept
     {
@@ -90,64 +116,64 @@ namespace filters::passive
     template<typename T>
     BiquadCoeffs<T> Biquad<T>::LowPass(T fc, T fs, T Q) noexcept
     {
-        const T w0{ T{ 2 } * std::numbers::pi_v<T> * fc / fs };
-        const T cw{ math::Cos(w0) };
-        const T alpha{ math::Sin(w0) / (T{ 2 } * Q) };
-        const T a0{ T{ 1 } + alpha };
+        const auto [sw, cw] = math::SinCos(T{ 2 } * std::numbers::pi_v<T> * fc / fs);
+        const T alpha{ sw / (T{ 2 } * Q) };
+        const T invA0{ T{ 1 } / (T{ 1 } + alpha) };
+        const T b1{ (T{ 1 } - cw) * invA0 };
         return BiquadCoeffs<T>{
-            (T{ 1 } - cw) / (T{ 2 } * a0),
-            (T{ 1 } - cw) / a0,
-            (T{ 1 } - cw) / (T{ 2 } * a0),
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha) / a0
+            b1 * T{ 0.5 },
+            b1,
+            b1 * T{ 0.5 },
+            T{ -2 } * cw * invA0,
+            (T{ 1 } - alpha) * invA0
         };
     }
 
     template<typename T>
     BiquadCoeffs<T> Biquad<T>::HighPass(T fc, T fs, T Q) noexcept
     {
-        const T w0{ T{ 2 } * std::numbers::pi_v<T> * fc / fs };
-        const T cw{ math::Cos(w0) };
-        const T alpha{ math::Sin(w0) / (T{ 2 } * Q) };
-        const T a0{ T{ 1 } + alpha };
+        const auto [sw, cw] = math::SinCos(T{ 2 } * std::numbers::pi_v<T> * fc / fs);
+        const T alpha{ sw / (T{ 2 } * Q) };
+        const T invA0{ T{ 1 } / (T{ 1 } + alpha) };
+        const T b0{ (T{ 1 } + cw) * T{ 0.5 } * invA0 };
         return BiquadCoeffs<T>{
-            (T{ 1 } + cw) / (T{ 2 } * a0),
-            -(T{ 1 } + cw) / a0,
-            (T{ 1 } + cw) / (T{ 2 } * a0),
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha) / a0
+            b0,
+            T{ -2 } * b0,
+            b0,
+            T{ -2 } * cw * invA0,
+            (T{ 1 } - alpha) * invA0
         };
     }
 
     template<typename T>
     BiquadCoeffs<T> Biquad<T>::BandPass(T fc, T fs, T Q) noexcept
     {
-        const T w0{ T{ 2 } * std::numbers::pi_v<T> * fc / fs };
-        const T alpha{ math::Sin(w0) / (T{ 2 } * Q) };
-        const T cw{ math::Cos(w0) };
-        const T a0{ T{ 1 } + alpha };
+        const auto [sw, cw] = math::SinCos(T{ 2 } * std::numbers::pi_v<T> * fc / fs);
+        const T alpha{ sw / (T{ 2 } * Q) };
+        const T invA0{ T{ 1 } / (T{ 1 } + alpha) };
+        const T b0{ sw * T{ 0.5 } * invA0 };
         return BiquadCoeffs<T>{
-            (math::Sin(w0) / T{ 2 }) / a0,
+            b0,
             T{ 0 },
-            -(math::Sin(w0) / T{ 2 }) / a0,
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha) / a0
+            -b0,
+            T{ -2 } * cw * invA0,
+            (T{ 1 } - alpha) * invA0
         };
     }
 
     template<typename T>
     BiquadCoeffs<T> Biquad<T>::Notch(T fc, T fs, T Q) noexcept
     {
-        const T w0{ T{ 2 } * std::numbers::pi_v<T> * fc / fs };
-        const T cw{ math::Cos(w0) };
-        const T alpha{ math::Sin(w0) / (T{ 2 } * Q) };
-        const T a0{ T{ 1 } + alpha };
+        const auto [sw, cw] = math::SinCos(T{ 2 } * std::numbers::pi_v<T> * fc / fs);
+        const T alpha{ sw / (T{ 2 } * Q) };
+        const T invA0{ T{ 1 } / (T{ 1 } + alpha) };
+        const T a1{ T{ -2 } * cw * invA0 };
         return BiquadCoeffs<T>{
-            T{ 1 } / a0,
-            (T{ -2 } * cw) / a0,
-            T{ 1 } / a0,
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha) / a0
+            invA0,
+            a1,
+            invA0,
+            a1,
+            (T{ 1 } - alpha) * invA0
         };
     }
 
@@ -155,16 +181,18 @@ namespace filters::passive
     BiquadCoeffs<T> Biquad<T>::Peaking(T fc, T fs, T Q, T gainDb) noexcept
     {
         const T A{ math::Pow(T{ 10 }, gainDb / T{ 40 }) };
-        const T w0{ T{ 2 } * std::numbers::pi_v<T> * fc / fs };
-        const T cw{ math::Cos(w0) };
-        const T alpha{ math::Sin(w0) / (T{ 2 } * Q) };
-        const T a0{ T{ 1 } + alpha / A };
+        const auto [sw, cw] = math::SinCos(T{ 2 } * std::numbers::pi_v<T> * fc / fs);
+        const T alpha{ sw / (T{ 2 } * Q) };
+        const T alphaA{ alpha * A };
+        const T alphaOverA{ alpha / A };
+        const T invA0{ T{ 1 } / (T{ 1 } + alphaOverA) };
+        const T a1{ T{ -2 } * cw * invA0 };
         return BiquadCoeffs<T>{
-            (T{ 1 } + alpha * A) / a0,
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha * A) / a0,
-            (T{ -2 } * cw) / a0,
-            (T{ 1 } - alpha / A) / a0
+            (T{ 1 } + alphaA) * invA0,
+            a1,
+            (T{ 1 } - alphaA) * invA0,
+            a1,
+            (T{ 1 } - alphaOverA) * invA0
         };
     }
 
@@ -190,6 +218,18 @@ namespace filters::passive
         return x;
     }
 
+    template<typename T, std::size_t Sections>
+    OPTIMIZE_FOR_SPEED void BiquadCascade<T, Sections>::Filter(std::span<const T> input, std::span<T> output) noexcept
+    {
+        really_assert(output.size() >= input.size());
+
+        stages[0].Filter(input, output);
+
+        const std::span<T> block{ output.first(input.size()) };
+        for (std::size_t s = 1; s < Sections; ++s)
+            stages[s].Filter(block, block);
+    }
+
     template<typename T, std::size_t Sections>
     void BiquadCascade<T, Sections>::Reset() noexcept
     {
@@ -44,7 +44,7 @@ namespace filters::passive
 
         QNumberType output{};
         for (std::size_t i = 0; i < N; ++i)
-            output += b[n - static_cast<int32_t>(i)] * x[n - static_cast<int32_t>(i)];
+            output = math::MultiplyAdd(b[n - static_cast<int32_t>(i)], x[n - static_cast<int32_t>(i)], output);
 
         return output;
     }
@@ -47,11 +47,11 @@ namespace filters::passive
 
         QNumberType feedforward{};
         for (std::size_t i = 0; i < P; ++i)
-            feedforward += b[n - static_cast<int32_t>(i)] * x[n - static_cast<int32_t>(i)];
+            feedforward = math::MultiplyAdd(b[n - static_cast<int32_t>(i)], x[n - static_cast<int32_t>(i)], feedforward);
 
         QNumberType feedback{};
         for (std::size_t i = 0; i < Q; ++i)
-            feedback += a[n - static_cast<int32_t>(i)] * y[n - static_cast<int32_t>(i)];
+            feedback = math::MultiplyAdd(a[n - static_cast<int32_t>(i)], y[n - static_cast<int32_t>(i)], feedback);
 
         const auto output = feedforward + feedback;
         y.Update(output);
@@ -378,3 +378,18 @@ TEST_F(TestBiquadCascade, lowpass_bounded_output_long_run)
     EXPECT_FALSE(anyNan);
     EXPECT_FALSE(anyInf);
 }
+
+TEST_F(TestBiquadCascade, block_filter_matches_per_sample_filter)
+{
+    filters::passive::BiquadCascade<float, 2> perSample{ { LpCoeffs(), HpCoeffs() } };
+    filters::passive::BiquadCascade<float, 2> block{ { LpCoeffs(), HpCoeffs() } };
+
+    constexpr std::array<float, 8> inputs{ 1.0f, -0.5f, 0.3f, 0.7f, -0.2f, 0.9f, -0.4f, 0.1f };
+    std::array<float, 8> outputs{};
+
+    block.Filter(std::span<const float>{ inputs.data(), 5 }, std::span<float>{ outputs.data(), 5 });
+    block.Filter(std::span<const float>{ inputs.data() + 5, 3 }, std::span<float>{ outputs.data() + 5, 3 });
+
+    for (std::size_t i = 0; i < inputs.size(); ++i)
+        EXPECT_NEAR(outputs[i], perSample.Filter(inputs[i]), 1e-6f);
+}
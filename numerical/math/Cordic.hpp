@@ -8,6 +8,7 @@
 #include "numerical/math/Math.hpp"
 #include <array>
 #include <cstddef>
+#include <limits>
 #include <numbers>
 #include <type_traits>
 
@@ -17,6 +18,7 @@ namespace math
     class Cordic
     {
         static_assert(std::is_floating_point_v<T>, "Cordic supports floating-point types only");
+        static_assert(Iterations <= std::numeric_limits<double>::digits, "Cordic iterations beyond double precision add nothing");
 
     public:
         struct SinCos
@@ -59,24 +61,48 @@ namespace math
             return VectoringResult{ xv, z };
         }
 
-        static std::array<T, Iterations> BuildAtanTable()
+        static constexpr double AtanOfPowerOfTwo(std::size_t i)
+        {
+            if (i == 0)
+                return std::numbers::pi / 4.0;
+
+            const double x{ 1.0 / static_cast<double>(std::size_t(1) << i) };
+            double term{ x };
+            double sum{ 0.0 };
+            for (std::size_t n = 0; n < 32; ++n)
+            {
+                sum += term / static_cast<double>(2 * n + 1);
+                term *= -x * x;
+            }
+            return sum;
+        }
+
+        static constexpr std::array<T, Iterations> BuildAtanTable()
         {
             std::array<T, Iterations> table{};
             for (std::size_t i = 0; i < Iterations; ++i)
-                table[i] = static_cast<T>(math::Atan(math::Pow(T(2), -static_cast<T>(i))));
+                table[i] = static_cast<T>(AtanOfPowerOfTwo(i));
             return table;
         }
 
-        static T ComputeK()
+        static constexpr T ComputeK()
         {
-            T k{ T(1) };
+            double gainSquared{ 1.0 };
             for (std::size_t i = 0; i < Iterations; ++i)
-                k *= static_cast<T>(math::Cos(math::Atan(math::Pow(T(2), -static_cast<T>(i)))));
-            return k;
+            {
+                const double pow2i{ 1.0 / static_cast<double>(std::size_t(1) << i) };
+                gainSquared *= 1.0 + pow2i * pow2i;
+            }
+
+            double gain{ gainSquared };
+            for (std::size_t n = 0; n < 32; ++n)
+                gain = 0.5 * (gain + gainSquared / gain);
+
+            return static_cast<T>(1.0 / gain);
         }
 
-        static inline const std::array<T, Iterations> atanTable{ BuildAtanTable() };
-        static inline const T K{ ComputeK() };
+        static constexpr std::array<T, Iterations> atanTable{ BuildAtanTable() };
+        static constexpr T K{ ComputeK() };
     };
 
     template<typename T, std::size_t Iterations>
@@ -85,22 +111,11 @@ namespace math
         const T pi{ std::numbers::pi_v<T> };
         const T halfPi{ pi / T(2) };
 
-        T angle{ angleRadians };
-        T sinSign{ T(1) };
-        T cosSign{ T(1) };
+        const bool folded{ angleRadians > halfPi || angleRadians < -halfPi };
+        const T fold{ (angleRadians > halfPi) ? -pi : pi };
+        const T sign{ folded ? T(-1) : T(1) };
 
-        if (angle > halfPi)
-        {
-            angle -= pi;
-            sinSign = T(-1);
-            cosSign = T(-1);
-        }
-        else if (angle < -halfPi)
-        {
-            angle += pi;
-            sinSign = T(-1);
-            cosSign = T(-1);
-        }
+        T angle{ angleRadians + (folded ? fold : T(0)) };
 
         T x{ K };
         T y{ T(0) };
@@ -117,7 +132,7 @@ namespace math
             y = yNew;
         }
 
-        return SinCos{ sinSign * y, cosSign * x };
+        return SinCos{ sign * y, sign * x };
     }
 
     template<typename T, std::size_t Iterations>
@@ -125,24 +140,12 @@ namespace math
     {
         const T pi{ std::numbers::pi_v<T> };
 
-        T quadrantOffset{ T(0) };
-        T xv{ x };
-        T yv{ y };
-
-        if (xv < T(0) && yv >= T(0))
-        {
-            xv = -x;
-            yv = -y;
-            quadrantOffset = pi;
-        }
-        else if (xv < T(0) && yv < T(0))
-        {
-            xv = -x;
-            yv = -y;
-            quadrantOffset = -pi;
-        }
+        const bool leftHalfPlane{ x < T(0) };
+        const T mirror{ leftHalfPlane ? T(-1) : T(1) };
+        const T halfTurn{ (y >= T(0)) ? pi : -pi };
+        const T quadrantOffset{ leftHalfPlane ? halfTurn : T(0) };
 
-        auto res = VectoringMode(xv, yv);
+        auto res = VectoringMode(mirror * x, mirror * y);
         return res.angle + quadrantOffset;
     }
 
@@ -42,18 +42,26 @@ namespace math
     template<typename T>
     ALWAYS_INLINE_HOT Matrix3<T> RotationAboutAxis(const Vector3<T>& axis, T angle)
     {
-        T c = math::Cos(angle);
-        T s = math::Sin(angle);
+        auto [s, c] = math::SinCos(angle);
         T t = T(1) - c;
 
         T x = axis.at(0, 0);
         T y = axis.at(1, 0);
         T z = axis.at(2, 0);
 
+        T tx = t * x;
+        T ty = t * y;
+        T txy = tx * y;
+        T txz = tx * z;
+        T tyz = ty * z;
+        T sx = s * x;
+        T sy = s * y;
+        T sz = s * z;
+
         return Matrix3<T>{
-            { t * x * x + c, t * x * y - s * z, t * x * z + s * y },
-            { t * x * y + s * z, t * y * y + c, t * y * z - s * x },
-            { t * x * z - s * y, t * y * z + s * x, t * z * z + c }
+            { tx * x + c, txy - sz, txz + sy },
+            { txy + sz, ty * y + c, tyz - sx },
+            { txz - sy, tyz + sx, t * z * z + c }
         };
     }
 
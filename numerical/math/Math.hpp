@@ -9,6 +9,13 @@
 
 namespace math
 {
+    template<typename T>
+    struct SinCosResult
+    {
+        T sin;
+        T cos;
+    };
+
 #ifndef MATH_ABS_OVERRIDE
     template<typename T>
     constexpr T Abs(T x)
@@ -45,6 +52,15 @@ namespace math
     }
 #endif
 
+#ifndef MATH_SINCOS_OVERRIDE
+    template<typename T>
+    constexpr SinCosResult<T> SinCos(T x)
+    {
+        static_assert(std::is_floating_point_v<T>, "T must be a floating-point type");
+        return SinCosResult<T>{ Sin(x), Cos(x) };
+    }
+#endif
+
 #ifndef MATH_TAN_OVERRIDE
     template<typename T>
     constexpr T Tan(T x)
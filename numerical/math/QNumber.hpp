@@ -1,11 +1,13 @@
 #pragma once
 #include "infra/util/ReallyAssert.hpp"
 #include "numerical/math/CompilerOptimizations.hpp"
+#include <algorithm>
 #include <chrono>
 #include <compare>
 #include <cstdint>
 #include <limits>
 #include <numbers>
+#include <type_traits>
 
 #if defined(__GNUC__) || defined(__clang__)
 #pragma GCC optimize("O3", "fast-math")
@@ -27,7 +29,16 @@ namespace math
     }
 
     template<typename T>
-    OPTIMIZE_FOR_SPEED float Min()
+    OPTIMIZE_FOR_SPEED constexpr T MultiplyAdd(T lhs, T rhs, T addend)
+    {
+        if constexpr (std::is_floating_point_v<T>)
+            return lhs * rhs + addend;
+        else
+            return lhs.MultiplyAdd(rhs, addend);
+    }
+
+    template<typename T>
+    OPTIMIZE_FOR_SPEED constexpr float Min()
     {
         if constexpr (std::is_same_v<T, float>)
             return std::numeric_limits<float>::min();
@@ -36,7 +47,7 @@ namespace math
     }
 
     template<typename T>
-    OPTIMIZE_FOR_SPEED float Max()
+    OPTIMIZE_FOR_SPEED constexpr float Max()
     {
         if constexpr (std::is_same_v<T, float>)
             return std::numeric_limits<float>::max();
@@ -45,7 +56,7 @@ namespace math
     }
 
     template<typename T>
-    OPTIMIZE_FOR_SPEED float Lowest()
+    OPTIMIZE_FOR_SPEED constexpr float Lowest()
     {
         if constexpr (std::is_same_v<T, float>)
             return std::numeric_limits<float>::lowest();
@@ -57,34 +68,37 @@ namespace math
     class QNumber
     {
     public:
-        QNumber();
+        constexpr QNumber();
         explicit constexpr QNumber(float f);
-        explicit QNumber(IntType rawValue);
+        explicit constexpr QNumber(IntType rawValue);
 
         constexpr float ToFloat() const;
-        IntType RawValue() const;
+        constexpr IntType RawValue() const;
+        constexpr QNumber MultiplyAdd(const QNumber& rhs, const QNumber& addend) const;
 
-        OPTIMIZE_FOR_SPEED friend QNumber operator+(const QNumber& lhs, const QNumber& rhs)
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber operator+(const QNumber& lhs, const QNumber& rhs)
         {
+            auto temp = static_cast<WideType>(lhs.value) + rhs.value;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
-            really_assert((rhs.value <= 0 || lhs.value <= std::numeric_limits<IntType>::max() - rhs.value) &&
-                          (rhs.value >= 0 || lhs.value >= std::numeric_limits<IntType>::min() - rhs.value));
+            really_assert(temp <= std::numeric_limits<IntType>::max() &&
+                          temp >= std::numeric_limits<IntType>::min());
 #endif
-            return QNumber(static_cast<IntType>(lhs.value + rhs.value));
+            return QNumber(static_cast<IntType>(temp));
         }
 
-        OPTIMIZE_FOR_SPEED friend QNumber operator-(const QNumber& lhs, const QNumber& rhs)
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber operator-(const QNumber& lhs, const QNumber& rhs)
         {
+            auto temp = static_cast<WideType>(lhs.value) - rhs.value;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
-            really_assert((rhs.value >= 0 || lhs.value <= std::numeric_limits<IntType>::max() + rhs.value) &&
-                          (rhs.value <= 0 || lhs.value >= std::numeric_limits<IntType>::min() + rhs.value));
+            really_assert(temp <= std::numeric_limits<IntType>::max() &&
+                          temp >= std::numeric_limits<IntType>::min());
 #endif
-            return QNumber(static_cast<IntType>(lhs.value - rhs.value));
+            return QNumber(static_cast<IntType>(temp));
         }
 
-        OPTIMIZE_FOR_SPEED friend QNumber operator*(const QNumber& lhs, const QNumber& rhs)
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber operator*(const QNumber& lhs, const QNumber& rhs)
         {
-            auto temp = static_cast<int64_t>(lhs.value) * rhs.value;
+            auto temp = static_cast<WideType>(lhs.value) * rhs.value;
             temp >>= FractionalBits;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
             really_assert(temp <= std::numeric_limits<IntType>::max() &&
@@ -93,7 +107,7 @@ namespace math
             return QNumber(static_cast<IntType>(temp));
         }
 
-        OPTIMIZE_FOR_SPEED friend QNumber operator/(const QNumber& lhs, const QNumber& rhs)
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber operator/(const QNumber& lhs, const QNumber& rhs)
         {
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
             really_assert(rhs.value != 0);
@@ -107,13 +121,28 @@ namespace math
             return QNumber(static_cast<IntType>(result));
         }
 
-        QNumber& operator+=(const QNumber& other);
-        QNumber& operator-=(const QNumber& other);
-        QNumber& operator*=(const QNumber& other);
-        QNumber& operator/=(const QNumber& other);
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber SaturatingAdd(const QNumber& lhs, const QNumber& rhs)
+        {
+            return QNumber(Saturate(static_cast<WideType>(lhs.value) + rhs.value));
+        }
 
-        QNumber operator+() const;
-        QNumber operator-() const;
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber SaturatingSubtract(const QNumber& lhs, const QNumber& rhs)
+        {
+            return QNumber(Saturate(static_cast<WideType>(lhs.value) - rhs.value));
+        }
+
+        OPTIMIZE_FOR_SPEED friend constexpr QNumber SaturatingMultiply(const QNumber& lhs, const QNumber& rhs)
+        {
+            return QNumber(Saturate((static_cast<WideType>(lhs.value) * rhs.value) >> FractionalBits));
+        }
+
+        constexpr QNumber& operator+=(const QNumber& other);
+        constexpr QNumber& operator-=(const QNumber& other);
+        constexpr QNumber& operator*=(const QNumber& other);
+        constexpr QNumber& operator/=(const QNumber& other);
+
+        constexpr QNumber operator+() const;
+        constexpr QNumber operator-() const;
 
         friend auto operator<=>(const QNumber&, const QNumber&) = default;
 
@@ -123,8 +152,18 @@ namespace math
         }
 
     private:
+        using WideType = std::conditional_t<(sizeof(IntType) < sizeof(int32_t)), int32_t, int64_t>;
+
+        static constexpr float scale = static_cast<float>(1LL << FractionalBits);
+        static constexpr float inverseScale = 1.0f / scale;
+
         IntType value;
 
+        static constexpr IntType Saturate(WideType raw)
+        {
+            return static_cast<IntType>(std::min<WideType>(std::max<WideType>(raw, std::numeric_limits<IntType>::min()), std::numeric_limits<IntType>::max()));
+        }
+
         static constexpr IntType round(float f)
         {
             if (f >= 0.0f)
@@ -136,13 +175,18 @@ namespace math
         static constexpr IntType FloatToFixed(float f)
         {
             really_assert(f >= -1.0f && f < 1.0f);
-            return static_cast<IntType>(round(f * (1LL << FractionalBits)));
+            return static_cast<IntType>(round(f * scale));
         }
     };
 
     using Q31 = QNumber<int32_t, 31>;
     using Q15 = QNumber<int16_t, 15>;
 
+    static_assert(sizeof(Q31) == sizeof(int32_t) && std::is_trivially_copyable_v<Q31>,
+        "Q31 must be a plain 32-bit value so arrays of it pack like int32_t.");
+    static_assert(sizeof(Q15) == sizeof(int16_t) && std::is_trivially_copyable_v<Q15>,
+        "Q15 must be a plain 16-bit value so arrays of it pack like int16_t.");
+
     template<typename T>
     struct is_qnumber : std::false_type
     {};
@@ -157,7 +201,7 @@ namespace math
     // Implementation
 
     template<typename IntType, int FractionalBits>
-    QNumber<IntType, FractionalBits>::QNumber()
+    constexpr QNumber<IntType, FractionalBits>::QNumber()
         : value(0)
     {}
 
@@ -167,48 +211,50 @@ namespace math
     {}
 
     template<typename IntType, int FractionalBits>
-    QNumber<IntType, FractionalBits>::QNumber(IntType rawValue)
+    constexpr QNumber<IntType, FractionalBits>::QNumber(IntType rawValue)
         : value(rawValue)
     {}
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED constexpr float QNumber<IntType, FractionalBits>::ToFloat() const
     {
-        return static_cast<float>(value) / (1LL << FractionalBits);
+        return static_cast<float>(value) * inverseScale;
     }
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>&
+        constexpr QNumber<IntType, FractionalBits>&
         QNumber<IntType, FractionalBits>::operator+=(const QNumber& other)
     {
+        auto temp = static_cast<WideType>(value) + other.value;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
-        really_assert((other.value <= 0 || value <= std::numeric_limits<IntType>::max() - other.value) &&
-                      (other.value >= 0 || value >= std::numeric_limits<IntType>::min() - other.value));
+        really_assert(temp <= std::numeric_limits<IntType>::max() &&
+                      temp >= std::numeric_limits<IntType>::min());
 #endif
-        value += other.value;
+        value = static_cast<IntType>(temp);
         return *this;
     }
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>&
+        constexpr QNumber<IntType, FractionalBits>&
         QNumber<IntType, FractionalBits>::operator-=(const QNumber& other)
     {
+        auto temp = static_cast<WideType>(value) - other.value;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
-        really_assert((other.value >= 0 || value <= std::numeric_limits<IntType>::max() + other.value) &&
-                      (other.value <= 0 || value >= std::numeric_limits<IntType>::min() + other.value));
+        really_assert(temp <= std::numeric_limits<IntType>::max() &&
+                      temp >= std::numeric_limits<IntType>::min());
 #endif
-        value -= other.value;
+        value = static_cast<IntType>(temp);
         return *this;
     }
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>&
+        constexpr QNumber<IntType, FractionalBits>&
         QNumber<IntType, FractionalBits>::operator*=(const QNumber& other)
     {
-        auto temp = static_cast<int64_t>(value) * other.value;
+        auto temp = static_cast<WideType>(value) * other.value;
         temp >>= FractionalBits;
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
         really_assert(temp <= std::numeric_limits<IntType>::max() &&
@@ -220,7 +266,7 @@ namespace math
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>&
+        constexpr QNumber<IntType, FractionalBits>&
         QNumber<IntType, FractionalBits>::operator/=(const QNumber& other)
     {
 #ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
@@ -238,7 +284,7 @@ namespace math
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>
+        constexpr QNumber<IntType, FractionalBits>
         QNumber<IntType, FractionalBits>::operator+() const
     {
         return QNumber(static_cast<IntType>(value));
@@ -246,20 +292,32 @@ namespace math
 
     template<typename IntType, int FractionalBits>
     OPTIMIZE_FOR_SPEED
-        QNumber<IntType, FractionalBits>
+        constexpr QNumber<IntType, FractionalBits>
         QNumber<IntType, FractionalBits>::operator-() const
     {
         return QNumber(static_cast<IntType>(-value));
     }
 
     template<typename IntType, int FractionalBits>
-    OPTIMIZE_FOR_SPEED
-        IntType
-        QNumber<IntType, FractionalBits>::RawValue() const
+    OPTIMIZE_FOR_SPEED constexpr IntType QNumber<IntType, FractionalBits>::RawValue() const
     {
         return value;
     }
 
+    template<typename IntType, int FractionalBits>
+    OPTIMIZE_FOR_SPEED
+        constexpr QNumber<IntType, FractionalBits>
+        QNumber<IntType, FractionalBits>::MultiplyAdd(const QNumber& rhs, const QNumber& addend) const
+    {
+        auto temp = static_cast<int64_t>(value) * rhs.value + (static_cast<int64_t>(addend.value) << FractionalBits);
+        temp >>= FractionalBits;
+#ifdef NUMERICAL_TOOLBOX_ENABLE_ASSERTIONS
+        really_assert(temp <= std::numeric_limits<IntType>::max() &&
+                      temp >= std::numeric_limits<IntType>::min());
+#endif
+        return QNumber(static_cast<IntType>(temp));
+    }
+
 #ifdef NUMERICAL_TOOLBOX_COVERAGE_BUILD
     extern template class QNumber<int32_t, 31>;
     extern template class QNumber<int16_t, 15>;
@@ -73,11 +73,10 @@ namespace math
     template<typename T>
     Quaternion<T> Quaternion<T>::FromAxisAngle(const Vector3<T>& axis, T angle)
     {
-        T halfAngle = angle * T(0.5);
-        T s = math::Sin(halfAngle);
+        auto [s, c] = math::SinCos(angle * T(0.5));
         T n = VectorNorm(axis);
         T invN = (n > T(0)) ? T(1) / n : T(0);
-        return Quaternion<T>{ math::Cos(halfAngle), axis.at(0, 0) * invN * s, axis.at(1, 0) * invN * s, axis.at(2, 0) * invN * s };
+        return Quaternion<T>{ c, axis.at(0, 0) * invN * s, axis.at(1, 0) * invN * s, axis.at(2, 0) * invN * s };
     }
 
     template<typename T>
@@ -123,12 +122,9 @@ namespace math
     template<typename T>
     Quaternion<T> Quaternion<T>::FromEulerZYX(T roll, T pitch, T yaw)
     {
-        T cr = math::Cos(roll * T(0.5));
-        T sr = math::Sin(roll * T(0.5));
-        T cp = math::Cos(pitch * T(0.5));
-        T sp = math::Sin(pitch * T(0.5));
-        T cy = math::Cos(yaw * T(0.5));
-        T sy = math::Sin(yaw * T(0.5));
+        auto [sr, cr] = math::SinCos(roll * T(0.5));
+        auto [sp, cp] = math::SinCos(pitch * T(0.5));
+        auto [sy, cy] = math::SinCos(yaw * T(0.5));
         return Quaternion<T>{
             cr * cp * cy + sr * sp * sy,
             sr * cp * cy - cr * sp * sy,
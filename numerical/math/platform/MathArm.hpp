@@ -13,6 +13,7 @@
 #define MATH_SQRT_OVERRIDE
 #define MATH_SIN_OVERRIDE
 #define MATH_COS_OVERRIDE
+#define MATH_SINCOS_OVERRIDE
 #define MATH_TAN_OVERRIDE
 #define MATH_ASIN_OVERRIDE
 #define MATH_ACOS_OVERRIDE
@@ -755,4 +756,11 @@ namespace math
 #error "MathArm.hpp included on an unsupported ARM architecture. Add a section for this core family."
 #endif
 
+    template<typename T>
+    SinCosResult<T> SinCos(T x)
+    {
+        static_assert(std::is_floating_point_v<T>, "T must be a floating-point type");
+        return SinCosResult<T>{ Sin(x), Cos(x) };
+    }
+
 }
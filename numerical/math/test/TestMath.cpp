@@ -0,0 +1,26 @@
+#include "numerical/math/Math.hpp"
+#include "numerical/math/Tolerance.hpp"
+#include <array>
+#include <cmath>
+#include <gtest/gtest.h>
+#include <numbers>
+
+namespace
+{
+    class TestMath
+        : public ::testing::Test
+    {
+    protected:
+        const std::array<float, 7> angles{ -std::numbers::pi_v<float>, -1.0f, -0.25f, 0.0f, 0.5f, 2.0f, std::numbers::pi_v<float> };
+    };
+}
+
+TEST_F(TestMath, SinCosMatchesStd)
+{
+    for (auto angle : angles)
+    {
+        auto result = math::SinCos(angle);
+        EXPECT_NEAR(result.sin, std::sin(angle), math::Tolerance<float>());
+        EXPECT_NEAR(result.cos, std::cos(angle), math::Tolerance<float>());
+    }
+}
@@ -62,6 +62,30 @@ TYPED_TEST(QNumberTest, RawValueConstructorPreservesRawValue)
     EXPECT_EQ(num.RawValue(), rawValue);
 }
 
+TYPED_TEST(QNumberTest, RawAndDefaultConstructorsAreCompileTime)
+{
+    using RawType = decltype(TypeParam{}.RawValue());
+
+    constexpr TypeParam zero;
+    constexpr TypeParam fromRaw(static_cast<RawType>(1234));
+
+    static_assert(zero.RawValue() == 0);
+    static_assert(fromRaw.RawValue() == 1234);
+}
+
+TYPED_TEST(QNumberTest, ArithmeticIsCompileTime)
+{
+    constexpr TypeParam a(0.50f);
+    constexpr TypeParam b(0.25f);
+
+    static_assert(a + b == TypeParam(0.75f));
+    static_assert(a - b == TypeParam(0.25f));
+    static_assert(a * b == TypeParam(0.125f));
+    static_assert(b / a == TypeParam(0.50f));
+    static_assert(-a == TypeParam(-0.50f));
+    static_assert(math::MultiplyAdd(a, b, b) == TypeParam(0.375f));
+}
+
 TYPED_TEST(QNumberTest, QuantizationErrorBoundedByHalfUlp)
 {
     using IntType = typename std::decay<decltype(std::declval<TypeParam>().RawValue())>::type;
@@ -104,6 +128,41 @@ TYPED_TEST(QNumberTest, Multiplication)
     EXPECT_NEAR(result.ToFloat(), 0.06f, math::Tolerance<float>());
 }
 
+TYPED_TEST(QNumberTest, MultiplyAddMatchesMultiplyThenAdd)
+{
+    TypeParam a(0.20f);
+    TypeParam b(-0.30f);
+    TypeParam c(0.45f);
+
+    TypeParam result = math::MultiplyAdd(a, b, c);
+
+    EXPECT_EQ(result, a * b + c);
+    EXPECT_NEAR(result.ToFloat(), 0.39f, math::Tolerance<float>());
+}
+
+TYPED_TEST(QNumberTest, SaturatingArithmeticMatchesOperatorsInRange)
+{
+    TypeParam a(0.20f);
+    TypeParam b(0.30f);
+
+    EXPECT_EQ(SaturatingAdd(a, b), a + b);
+    EXPECT_EQ(SaturatingSubtract(a, b), a - b);
+    EXPECT_EQ(SaturatingMultiply(a, b), a * b);
+}
+
+TYPED_TEST(QNumberTest, SaturatingArithmeticClampsToRange)
+{
+    using RawType = decltype(TypeParam{}.RawValue());
+
+    TypeParam high(0.75f);
+    TypeParam low(-0.75f);
+    TypeParam minusOne(-1.0f);
+
+    EXPECT_EQ(SaturatingAdd(high, high).RawValue(), std::numeric_limits<RawType>::max());
+    EXPECT_EQ(SaturatingSubtract(low, high).RawValue(), std::numeric_limits<RawType>::min());
+    EXPECT_EQ(SaturatingMultiply(minusOne, minusOne).RawValue(), std::numeric_limits<RawType>::max());
+}
+
 TYPED_TEST(QNumberTest, Division)
 {
     TypeParam a(0.20f);
@@ -317,3 +376,23 @@ TYPED_TEST(QNumberTest, DivideByZeroDies)
 
     EXPECT_DEATH_IF_SUPPORTED({ TypeParam result = a / zero; }, ""); // NOLINT
 }
+
+TYPED_TEST(QNumberTest, AdditionAndSubtractionOverflowDie)
+{
+    TypeParam high(0.75f);
+    TypeParam low(-0.75f);
+
+    EXPECT_DEATH_IF_SUPPORTED({ TypeParam result = high + high; }, ""); // NOLINT
+    EXPECT_DEATH_IF_SUPPORTED({ TypeParam result = low - high; }, "");  // NOLINT
+}
+
+TYPED_TEST(QNumberTest, RangeLimitsAreCompileTimeConstants)
+{
+    constexpr float min = math::Min<TypeParam>();
+    constexpr float max = math::Max<TypeParam>();
+    constexpr float lowest = math::Lowest<TypeParam>();
+
+    EXPECT_FLOAT_EQ(min, -0.9999f);
+    EXPECT_FLOAT_EQ(max, 0.9999f);
+    EXPECT_FLOAT_EQ(lowest, -0.9999f);
+}
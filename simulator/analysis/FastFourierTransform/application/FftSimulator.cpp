@@ -55,14 +55,13 @@ namespace simulator::analysis
             result.sampleRateHz = sampleRateHz;
 
             result.time.resize(N);
-            result.signal.resize(N);
-            result.windowedSignal.resize(N);
             for (std::size_t i = 0; i < N; ++i)
-            {
                 result.time[i] = static_cast<float>(i) / sampleRateHz;
-                result.signal[i] = i < signal.size() ? signal[i] : 0.0f;
-                result.windowedSignal[i] = i < windowedSignal.size() ? windowedSignal[i] : 0.0f;
-            }
+
+            result.signal.assign(signal.begin(), signal.begin() + std::min(signal.size(), N));
+            result.signal.resize(N, 0.0f);
+            result.windowedSignal.assign(windowedSignal.begin(), windowedSignal.begin() + std::min(windowedSignal.size(), N));
+            result.windowedSignal.resize(N, 0.0f);
 
             result.frequencies.resize(N / 2);
             result.magnitudes.resize(N / 2);
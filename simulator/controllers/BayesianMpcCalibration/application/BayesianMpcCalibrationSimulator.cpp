@@ -90,19 +90,19 @@ namespace simulator::controllers
         mpc.SetReference(ref);
 
         math::Vector<float, 2> state{};
-        results.stepResponseTime.reserve(StepResponseSteps);
-        results.stepResponsePosition.reserve(StepResponseSteps);
-        results.stepResponseVelocity.reserve(StepResponseSteps);
-        results.stepResponseControl.reserve(StepResponseSteps);
+        results.stepResponseTime.resize(StepResponseSteps);
+        results.stepResponsePosition.resize(StepResponseSteps);
+        results.stepResponseVelocity.resize(StepResponseSteps);
+        results.stepResponseControl.resize(StepResponseSteps);
 
         for (std::size_t k = 0; k < StepResponseSteps; ++k)
         {
-            results.stepResponseTime.push_back(static_cast<float>(k) * dt);
-            results.stepResponsePosition.push_back(state.at(0, 0));
-            results.stepResponseVelocity.push_back(state.at(1, 0));
+            results.stepResponseTime[k] = static_cast<float>(k) * dt;
+            results.stepResponsePosition[k] = state.at(0, 0);
+            results.stepResponseVelocity[k] = state.at(1, 0);
 
             const auto u = mpc.ComputeControl(state);
-            results.stepResponseControl.push_back(u.at(0, 0));
+            results.stepResponseControl[k] = u.at(0, 0);
 
             state = A_true * state + B_true * u;
         }
@@ -51,10 +51,10 @@ namespace simulator::controllers
         std::normal_distribution<float> measureDist{ 0.0f, std::sqrt(n.measurementNoise) };
 
         std::size_t steps = static_cast<std::size_t>(sim.duration / sim.sampleTime);
-        result.time.reserve(steps);
-        result.trueState.reserve(steps);
-        result.estimatedState.reserve(steps);
-        result.control.reserve(steps);
+        result.time.resize(steps);
+        result.trueState.resize(steps);
+        result.estimatedState.resize(steps);
+        result.control.resize(steps);
 
         for (std::size_t k = 0; k < steps; ++k)
         {
@@ -69,10 +69,10 @@ namespace simulator::controllers
 
             trueState = plant.Step(trueState, u) + noise;
 
-            result.time.push_back(static_cast<float>(k) * sim.sampleTime);
-            result.trueState.push_back(trueState.at(0, 0));
-            result.estimatedState.push_back(controller.GetEstimatedState().at(0, 0));
-            result.control.push_back(u.at(0, 0));
+            result.time[k] = static_cast<float>(k) * sim.sampleTime;
+            result.trueState[k] = trueState.at(0, 0);
+            result.estimatedState[k] = controller.GetEstimatedState().at(0, 0);
+            result.control[k] = u.at(0, 0);
         }
 
         return result;
@@ -36,11 +36,7 @@ namespace simulator::controllers::lqr
         state.thetaDot += thetaDDot * dt;
         state.theta += state.thetaDot * dt;
 
-        // Wrap theta to [-pi, pi]
-        while (state.theta > pi)
-            state.theta -= twoPi;
-        while (state.theta < -pi)
-            state.theta += twoPi;
+        state.theta -= twoPi * std::floor((state.theta + pi) / twoPi);
     }
 
     void CartPolePlant::Reset()
@@ -71,8 +71,6 @@ namespace simulator::controllers::lqr::view
         time.clear();
         xHistory.clear();
         xDotHistory.clear();
-        thetaHistory.clear();
-        thetaDotHistory.clear();
         thetaDegHistory.clear();
         thetaDotDegHistory.clear();
         forceHistory.clear();
@@ -105,8 +103,6 @@ namespace simulator::controllers::lqr::view
         time.push_back(t);
         xHistory.push_back(x);
         xDotHistory.push_back(xDot);
-        thetaHistory.push_back(theta);
-        thetaDotHistory.push_back(thetaDot);
         thetaDegHistory.push_back(theta * radToDeg);
         thetaDotDegHistory.push_back(thetaDot * radToDeg);
         forceHistory.push_back(force);
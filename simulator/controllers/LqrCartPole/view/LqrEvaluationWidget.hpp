@@ -31,8 +31,6 @@ namespace simulator::controllers::lqr::view
         std::vector<float> time;
         std::vector<float> xHistory;
         std::vector<float> xDotHistory;
-        std::vector<float> thetaHistory;
-        std::vector<float> thetaDotHistory;
         std::vector<float> thetaDegHistory;
         std::vector<float> thetaDotDegHistory;
         std::vector<float> forceHistory;
@@ -50,23 +50,25 @@ namespace simulator::controllers
         auto state = math::Vector<float, 2>{ 0.0f, 0.0f };
 
         auto response = MpcTimeResponse{};
-        response.states.resize(2);
+        response.time.resize(numSamples);
+        response.states.assign(2, std::vector<float>(numSamples));
+        response.control.resize(numSamples);
+        response.cost.resize(numSamples);
 
         for (std::size_t i = 0; i < numSamples; ++i)
         {
-            response.time.push_back(static_cast<float>(i) * dt);
-            response.states[0].push_back(state.at(0, 0));
-            response.states[1].push_back(state.at(1, 0));
+            response.time[i] = static_cast<float>(i) * dt;
+            response.states[0][i] = state.at(0, 0);
+            response.states[1][i] = state.at(1, 0);
 
             auto u = mpc.ComputeControl(state);
-            response.control.push_back(u.at(0, 0));
+            response.control[i] = u.at(0, 0);
 
             auto posError = state.at(0, 0) - configuration.referencePosition;
             auto velError = state.at(1, 0);
-            auto costStep = configuration.weights.stateWeight * posError * posError +
-                            velError * velError +
-                            configuration.weights.controlWeight * u.at(0, 0) * u.at(0, 0);
-            response.cost.push_back(costStep);
+            response.cost[i] = configuration.weights.stateWeight * posError * posError +
+                               velError * velError +
+                               configuration.weights.controlWeight * u.at(0, 0) * u.at(0, 0);
 
             state = plant.Step(state, u);
         }
@@ -74,6 +74,7 @@ namespace simulator::controllers::view
         };
 
         std::vector<widgets::Series> stateSeries;
+        stateSeries.reserve(result.states.size() + 1);
         for (std::size_t i = 0; i < result.states.size(); ++i)
         {
             stateSeries.push_back({
@@ -228,6 +228,7 @@ namespace simulator::controllers
         auto toStd = [](const auto& source, std::vector<std::complex<float>>& destination)
         {
             destination.clear();
+            destination.reserve(source.size());
             for (const auto& value : source)
                 destination.emplace_back(value.Real(), value.Imaginary());
         };
@@ -6,6 +6,7 @@ namespace simulator::controllers
     FirstOrderPlant::FirstOrderPlant(float gain, float timeConstant)
         : gain(gain)
         , timeConstant(timeConstant)
+        , inverseTimeConstant(1.0f / timeConstant)
     {
     }
 
@@ -21,7 +22,7 @@ namespace simulator::controllers
 
     void FirstOrderPlant::Step(float input, float dt)
     {
-        float dx = (-state + gain * input) / timeConstant;
+        float dx = (gain * input - state) * inverseTimeConstant;
         state += dx * dt;
     }
 
@@ -32,19 +33,20 @@ namespace simulator::controllers
 
     std::vector<std::complex<float>> FirstOrderPlant::Poles() const
     {
-        return { { -1.0f / timeConstant, 0.0f } };
+        return { { -inverseTimeConstant, 0.0f } };
     }
 
     SecondOrderPlant::SecondOrderPlant(float naturalFrequency, float dampingRatio)
         : naturalFrequency(naturalFrequency)
         , dampingRatio(dampingRatio)
+        , naturalFrequencySquared(naturalFrequency * naturalFrequency)
+        , dampingTerm(2.0f * dampingRatio * naturalFrequency)
     {
     }
 
     TransferFunction SecondOrderPlant::GetTransferFunction() const
     {
-        float wn2 = naturalFrequency * naturalFrequency;
-        return { { wn2 }, { 1.0f, 2.0f * dampingRatio * naturalFrequency, wn2 } };
+        return { { naturalFrequencySquared }, { 1.0f, dampingTerm, naturalFrequencySquared } };
     }
 
     float SecondOrderPlant::Output() const
@@ -54,9 +56,8 @@ namespace simulator::controllers
 
     void SecondOrderPlant::Step(float input, float dt)
     {
-        float wn2 = naturalFrequency * naturalFrequency;
         float dx1 = x2;
-        float dx2 = -2.0f * dampingRatio * naturalFrequency * x2 - wn2 * x1 + wn2 * input;
+        float dx2 = naturalFrequencySquared * (input - x1) - dampingTerm * x2;
         x1 += dx1 * dt;
         x2 += dx2 * dt;
     }
@@ -38,6 +38,7 @@ namespace simulator::controllers
     private:
         float gain;
         float timeConstant;
+        float inverseTimeConstant;
         float state = 0.0f;
     };
 
@@ -56,6 +57,8 @@ namespace simulator::controllers
     private:
         float naturalFrequency;
         float dampingRatio;
+        float naturalFrequencySquared;
+        float dampingTerm;
         float x1 = 0.0f;
         float x2 = 0.0f;
     };
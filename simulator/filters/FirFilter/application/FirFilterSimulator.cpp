@@ -13,6 +13,8 @@ namespace simulator::filters::fir
         {
             std::vector<float> coeffs(order);
             auto mid = static_cast<float>(order - 1) / 2.0f;
+            auto cutoffOmega = 2.0f * std::numbers::pi_v<float> * normalizedCutoff;
+            auto windowOmega = 2.0f * std::numbers::pi_v<float> / static_cast<float>(order - 1);
 
             for (std::size_t i = 0; i < order; ++i)
             {
@@ -22,9 +24,9 @@ namespace simulator::filters::fir
                 if (std::abs(n) < 1e-6f)
                     sinc = 2.0f * normalizedCutoff;
                 else
-                    sinc = std::sin(2.0f * std::numbers::pi_v<float> * normalizedCutoff * n) / (std::numbers::pi_v<float> * n);
+                    sinc = std::sin(cutoffOmega * n) / (std::numbers::pi_v<float> * n);
 
-                auto hamming = 0.54f - 0.46f * std::cos(2.0f * std::numbers::pi_v<float> * static_cast<float>(i) / static_cast<float>(order - 1));
+                auto hamming = 0.54f - 0.46f * std::cos(windowOmega * static_cast<float>(i));
                 coeffs[i] = sinc * hamming;
             }
 
@@ -66,12 +68,10 @@ namespace simulator::filters::fir
 
             for (std::size_t n = 0; n < input.size(); ++n)
             {
+                std::size_t taps = std::min(coefficients.size(), n + 1);
                 float sum = 0.0f;
-                for (std::size_t k = 0; k < coefficients.size(); ++k)
-                {
-                    if (n >= k)
-                        sum += coefficients[k] * input[n - k];
-                }
+                for (std::size_t k = 0; k < taps; ++k)
+                    sum += coefficients[k] * input[n - k];
                 output[n] = sum;
             }
 
@@ -142,17 +142,11 @@ namespace simulator::filters::fir
             {
                 auto normalizedLow = design.cutoffHz / design.sampleRateHz;
                 auto normalizedHigh = design.cutoffHighHz / design.sampleRateHz;
-                auto highpass = WindowedSinc(design.order, normalizedHigh);
+                auto bandpass = WindowedSinc(design.order, normalizedHigh);
                 auto lowpass = WindowedSinc(design.order, normalizedLow);
 
-                auto mid = (design.order - 1) / 2;
-                for (std::size_t i = 0; i < lowpass.size(); ++i)
-                    lowpass[i] = -lowpass[i];
-                lowpass[mid] += 1.0f;
-
-                std::vector<float> bandpass(design.order);
                 for (std::size_t i = 0; i < design.order; ++i)
-                    bandpass[i] = highpass[i] - lowpass[i];
+                    bandpass[i] -= lowpass[i];
                 return bandpass;
             }
 
@@ -4,6 +4,7 @@
 #include "numerical/filters/active/UnscentedKalmanFilter.hpp"
 #include "numerical/math/LinearTimeInvariant.hpp"
 #include <cmath>
+#include <future>
 #include <random>
 
 namespace simulator::filters
@@ -21,27 +22,26 @@ namespace simulator::filters
             result.trueTheta.reserve(steps);
             result.trueThetaDot.reserve(steps);
             result.measuredTheta.reserve(steps);
-
-            auto reserveTrace = [steps](EstimatorTrace& trace)
-            {
-                trace.theta.reserve(steps);
-                trace.thetaDot.reserve(steps);
-                trace.covarianceTheta.reserve(steps);
-            };
-
-            reserveTrace(result.kf);
-            reserveTrace(result.ekf);
-            reserveTrace(result.ukf);
         }
 
         template<typename FilterType>
-        void RecordFilterEstimate(EstimatorTrace& trace, FilterType& filter, const MeasVec& measurement)
+        EstimatorTrace RunFilter(FilterType& filter, const std::vector<float>& measurements)
         {
-            filter.Predict();
-            filter.Update(measurement);
-            trace.theta.push_back(filter.GetState().at(0, 0));
-            trace.thetaDot.push_back(filter.GetState().at(1, 0));
-            trace.covarianceTheta.push_back(filter.GetCovariance().at(0, 0));
+            EstimatorTrace trace;
+            trace.theta.resize(measurements.size());
+            trace.thetaDot.resize(measurements.size());
+            trace.covarianceTheta.resize(measurements.size());
+
+            for (std::size_t i = 0; i < measurements.size(); ++i)
+            {
+                filter.Predict();
+                filter.Update(MeasVec{ { measurements[i] } });
+                trace.theta[i] = filter.GetState().at(0, 0);
+                trace.thetaDot[i] = filter.GetState().at(1, 0);
+                trace.covarianceTheta[i] = filter.GetCovariance().at(0, 0);
+            }
+
+            return trace;
         }
     }
 
@@ -149,13 +149,20 @@ namespace simulator::filters
             result.trueTheta.push_back(trueState.theta);
             result.trueThetaDot.push_back(trueState.thetaDot);
             result.measuredTheta.push_back(noisyTheta);
+        }
 
-            auto measurement = MeasVec{ { noisyTheta } };
+        auto kfTrace = std::async(std::launch::async, [&kf, &result]
+            {
+                return RunFilter(kf, result.measuredTheta);
+            });
+        auto ekfTrace = std::async(std::launch::async, [&ekf, &result]
+            {
+                return RunFilter(ekf, result.measuredTheta);
+            });
 
-            RecordFilterEstimate(result.kf, kf, measurement);
-            RecordFilterEstimate(result.ekf, ekf, measurement);
-            RecordFilterEstimate(result.ukf, ukf, measurement);
-        }
+        result.ukf = RunFilter(ukf, result.measuredTheta);
+        result.kf = kfTrace.get();
+        result.ekf = ekfTrace.get();
 
         return result;
     }
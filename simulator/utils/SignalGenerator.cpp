@@ -12,23 +12,46 @@ namespace simulator::utils
         if (sampleRateHz <= 0.0f)
             throw std::invalid_argument("Sample rate must be greater than zero.");
 
-        std::vector<float> signal(length, 0.0f);
+        std::vector<float> signal(length);
 
-        for (std::size_t i = 0; i < length; ++i)
+        bool addNoise = noise.type == NoiseType::WhiteGaussian && noise.amplitude > 0.0f;
+        std::mt19937 generator(42);
+        std::normal_distribution<float> distribution(0.0f, addNoise ? noise.amplitude : 1.0f);
+
+        struct Oscillator
         {
-            float t = static_cast<float>(i) / sampleRateHz;
+            double sine;
+            double cosine;
+            double stepSine;
+            double stepCosine;
+            float amplitude;
+        };
 
-            for (const auto& component : components)
-                signal[i] += component.amplitude * std::sin(2.0f * std::numbers::pi_v<float> * component.frequencyHz * t);
+        std::vector<Oscillator> oscillators;
+        oscillators.reserve(components.size());
+        for (const auto& component : components)
+        {
+            auto omega = 2.0 * std::numbers::pi * static_cast<double>(component.frequencyHz) / static_cast<double>(sampleRateHz);
+            oscillators.push_back({ 0.0, 1.0, std::sin(omega), std::cos(omega), component.amplitude });
         }
 
-        if (noise.type == NoiseType::WhiteGaussian && noise.amplitude > 0.0f)
+        for (std::size_t i = 0; i < length; ++i)
         {
-            std::mt19937 generator(42);
-            std::normal_distribution<float> distribution(0.0f, noise.amplitude);
+            float sample = 0.0f;
+
+            for (auto& oscillator : oscillators)
+            {
+                sample += oscillator.amplitude * static_cast<float>(oscillator.sine);
+
+                auto sine = oscillator.sine * oscillator.stepCosine + oscillator.cosine * oscillator.stepSine;
+                oscillator.cosine = oscillator.cosine * oscillator.stepCosine - oscillator.sine * oscillator.stepSine;
+                oscillator.sine = sine;
+            }
+
+            if (addNoise)
+                sample += distribution(generator);
 
-            for (std::size_t i = 0; i < length; ++i)
-                signal[i] += distribution(generator);
+            signal[i] = sample;
         }
 
         return signal;
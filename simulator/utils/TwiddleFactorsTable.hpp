@@ -14,10 +14,28 @@ namespace simulator::utils
     public:
         TwiddleFactorsTable()
         {
-            for (std::size_t k = 0; k < Length; ++k)
+            if constexpr (Length % 4 == 0)
             {
-                float angle = -std::numbers::pi_v<float> * static_cast<float>(k) / static_cast<float>(Length);
-                factors[k] = math::Complex<QNumberType>(std::cos(angle), std::sin(angle));
+                for (std::size_t k = 0; k <= Length / 4; ++k)
+                {
+                    float angle = -std::numbers::pi_v<float> * static_cast<float>(k) / static_cast<float>(Length);
+                    float c = std::cos(angle);
+                    float s = std::sin(angle);
+
+                    factors[k] = math::Complex<QNumberType>(c, s);
+                    factors[Length / 2 - k] = math::Complex<QNumberType>(-s, -c);
+                    factors[Length / 2 + k] = math::Complex<QNumberType>(s, -c);
+                    if (k > 0)
+                        factors[Length - k] = math::Complex<QNumberType>(-c, s);
+                }
+            }
+            else
+            {
+                for (std::size_t k = 0; k < Length; ++k)
+                {
+                    float angle = -std::numbers::pi_v<float> * static_cast<float>(k) / static_cast<float>(Length);
+                    factors[k] = math::Complex<QNumberType>(std::cos(angle), std::sin(angle));
+                }
             }
         }
 
@@ -1,6 +1,7 @@
 #include "simulator/widgets/FrequencyChartWidget.hpp"
 #include <QPainter>
 #include <QPen>
+#include <QPixmap>
 #include <algorithm>
 #include <cmath>
 #include <limits>
@@ -20,6 +21,7 @@ namespace simulator::widgets
     {
         freqData.assign(frequenciesHz.begin(), frequenciesHz.end());
         UpdateLogRange();
+        layoutsStale = true;
         update();
     }
 
@@ -27,6 +29,7 @@ namespace simulator::widgets
     {
         freqData = std::move(frequenciesHz);
         UpdateLogRange();
+        layoutsStale = true;
         update();
     }
 
@@ -50,6 +53,7 @@ namespace simulator::widgets
     void FrequencyChartWidget::SetPanels(std::vector<ChartPanel> panels)
     {
         chartPanels = std::move(panels);
+        layoutsStale = true;
         update();
     }
 
@@ -62,6 +66,7 @@ namespace simulator::widgets
         logMinFreq = 0.0f;
         logMaxFreq = 0.0f;
         interaction.SetDataRange(0.0f, 0.0f);
+        layoutsStale = true;
         update();
     }
 
@@ -110,16 +115,42 @@ namespace simulator::widgets
     {
         Q_UNUSED(event);
 
+        if (chartPanels.empty())
+            return;
+
+        if (layoutsStale || layoutSize != size() || layoutDevicePixelRatio != devicePixelRatioF() || layoutViewMin != interaction.viewMin || layoutViewMax != interaction.viewMax)
+        {
+            cachedLayouts = ComputeLayouts();
+            layoutsStale = false;
+            layoutSize = size();
+            layoutDevicePixelRatio = devicePixelRatioF();
+            layoutViewMin = interaction.viewMin;
+            layoutViewMax = interaction.viewMax;
+            RenderChart();
+        }
+
+        if (cachedLayouts.empty())
+            return;
+
         QPainter painter(this);
+        painter.drawPixmap(0, 0, chartPixmap);
         painter.setRenderHint(QPainter::Antialiasing);
+        DrawCrosshair(painter);
+    }
 
-        if (chartPanels.empty())
-            return;
+    void FrequencyChartWidget::RenderChart()
+    {
+        chartPixmap = QPixmap(size() * devicePixelRatioF());
+        chartPixmap.setDevicePixelRatio(devicePixelRatioF());
+        chartPixmap.fill(Qt::transparent);
 
-        cachedLayouts = ComputeLayouts();
         if (cachedLayouts.empty())
             return;
 
+        QPainter painter(&chartPixmap);
+        painter.setRenderHint(QPainter::Antialiasing);
+        painter.setFont(font());
+
         auto plotWidth = width() - leftMargin - rightMargin;
 
         for (const auto& layout : cachedLayouts)
@@ -174,8 +205,6 @@ namespace simulator::widgets
                 }
             }
         }
-
-        DrawCrosshair(painter);
     }
 
     void FrequencyChartWidget::DrawPanel(QPainter& painter, const QRect& plotArea, const ChartPanel& panel, const PanelBounds& bounds)
@@ -52,6 +52,7 @@ namespace simulator::widgets
         void DrawYLabels(QPainter& painter, const QRect& plotArea, const PanelBounds& bounds);
         void DrawLegend(QPainter& painter, const QRect& plotArea, const ChartPanel& panel);
         void DrawCrosshair(QPainter& painter);
+        void RenderChart();
         [[nodiscard]] PanelBounds ComputeBounds(const ChartPanel& panel) const;
         [[nodiscard]] std::vector<PanelLayout> ComputeLayouts() const;
         [[nodiscard]] float FreqToX(float freq, int plotLeft, int plotWidth) const;
@@ -65,6 +66,12 @@ namespace simulator::widgets
         float logMaxFreq = 0.0f;
         ChartInteraction interaction;
         std::vector<PanelLayout> cachedLayouts;
+        bool layoutsStale = true;
+        QSize layoutSize;
+        qreal layoutDevicePixelRatio = 0.0;
+        float layoutViewMin = 0.0f;
+        float layoutViewMax = 0.0f;
+        QPixmap chartPixmap;
 
         static constexpr int leftMargin = 65;
         static constexpr int rightMargin = 20;
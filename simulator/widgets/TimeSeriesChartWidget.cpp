@@ -1,6 +1,8 @@
 #include "simulator/widgets/TimeSeriesChartWidget.hpp"
 #include <QPainter>
 #include <QPen>
+#include <QPixmap>
+#include <QPolygonF>
 #include <algorithm>
 #include <cmath>
 #include <limits>
@@ -21,6 +23,7 @@ namespace simulator::widgets
         timeData.assign(time.begin(), time.end());
         maxTime = timeData.empty() ? 0.0f : timeData.back();
         interaction.SetDataRange(0.0f, maxTime);
+        layoutsStale = true;
         update();
     }
 
@@ -29,12 +32,14 @@ namespace simulator::widgets
         timeData = std::move(time);
         maxTime = timeData.empty() ? 0.0f : timeData.back();
         interaction.SetDataRange(0.0f, maxTime);
+        layoutsStale = true;
         update();
     }
 
     void TimeSeriesChartWidget::SetPanels(std::vector<ChartPanel> panels)
     {
         chartPanels = std::move(panels);
+        layoutsStale = true;
         update();
     }
 
@@ -44,6 +49,7 @@ namespace simulator::widgets
         chartPanels.clear();
         maxTime = 0.0f;
         interaction.SetDataRange(0.0f, 0.0f);
+        layoutsStale = true;
         update();
     }
 
@@ -91,24 +97,46 @@ namespace simulator::widgets
     {
         Q_UNUSED(event);
 
+        if (chartPanels.empty())
+            return;
+
+        if (layoutsStale || layoutSize != size() || layoutDevicePixelRatio != devicePixelRatioF() || layoutViewMin != interaction.viewMin || layoutViewMax != interaction.viewMax)
+        {
+            cachedLayouts = ComputeLayouts();
+            layoutsStale = false;
+            layoutSize = size();
+            layoutDevicePixelRatio = devicePixelRatioF();
+            layoutViewMin = interaction.viewMin;
+            layoutViewMax = interaction.viewMax;
+            RenderChart();
+        }
+
+        if (cachedLayouts.empty())
+            return;
+
         QPainter painter(this);
+        painter.drawPixmap(0, 0, chartPixmap);
         painter.setRenderHint(QPainter::Antialiasing);
+        DrawCrosshair(painter);
+    }
 
-        if (chartPanels.empty())
-            return;
+    void TimeSeriesChartWidget::RenderChart()
+    {
+        chartPixmap = QPixmap(size() * devicePixelRatioF());
+        chartPixmap.setDevicePixelRatio(devicePixelRatioF());
+        chartPixmap.fill(Qt::transparent);
 
-        cachedLayouts = ComputeLayouts();
         if (cachedLayouts.empty())
             return;
 
+        QPainter painter(&chartPixmap);
+        painter.setRenderHint(QPainter::Antialiasing);
+        painter.setFont(font());
+
         auto plotWidth = width() - leftMargin - rightMargin;
-        auto currentY = topMargin;
 
         for (const auto& layout : cachedLayouts)
-        {
             DrawPanel(painter, layout.plotArea, chartPanels[layout.panelIndex], layout.bounds);
-            currentY = layout.plotArea.bottom() + panelSpacing;
-        }
 
         QFont labelFont = painter.font();
         labelFont.setPointSize(9);
@@ -130,8 +158,6 @@ namespace simulator::widgets
             QRect labelRect(x - 25, lastPanelBottom + 2, 50, 14);
             painter.drawText(labelRect, Qt::AlignCenter, QString::number(static_cast<double>(t), 'f', 2));
         }
-
-        DrawCrosshair(painter);
     }
 
     void TimeSeriesChartWidget::DrawPanel(QPainter& painter, const QRect& plotArea, const ChartPanel& panel, const PanelBounds& bounds)
@@ -174,30 +200,25 @@ namespace simulator::widgets
         auto count = std::min(timeData.size(), series.data.size());
         auto stride = std::max<std::size_t>(1, count / static_cast<std::size_t>(plotArea.width() * 2));
 
-        QPointF prev;
-        auto hasPrev = false;
+        polyline.clear();
+        polyline.reserve(static_cast<qsizetype>(count / stride + 2));
 
-        for (std::size_t i = 0; i < count; i += stride)
+        auto toPoint = [&](std::size_t i)
         {
             auto x = TimeToX(timeData[i], plotArea.left(), plotArea.width());
             auto yRatio = (series.data[i] - bounds.minY) / range;
             auto y = static_cast<float>(plotArea.bottom()) - yRatio * plotArea.height();
+            return QPointF(x, y);
+        };
 
-            QPointF curr(x, y);
-            if (hasPrev)
-                painter.drawLine(prev, curr);
-            prev = curr;
-            hasPrev = true;
-        }
+        for (std::size_t i = 0; i < count; i += stride)
+            polyline.append(toPoint(i));
 
         auto lastIdx = count - 1;
-        if (hasPrev && lastIdx % stride != 0)
-        {
-            auto x = TimeToX(timeData[lastIdx], plotArea.left(), plotArea.width());
-            auto yRatio = (series.data[lastIdx] - bounds.minY) / range;
-            auto y = static_cast<float>(plotArea.bottom()) - yRatio * plotArea.height();
-            painter.drawLine(prev, QPointF(x, y));
-        }
+        if (lastIdx % stride != 0)
+            polyline.append(toPoint(lastIdx));
+
+        painter.drawPolyline(polyline);
 
         painter.setClipping(false);
     }
@@ -365,19 +386,20 @@ namespace simulator::widgets
     {
         PanelBounds bounds{ std::numeric_limits<float>::max(), std::numeric_limits<float>::lowest() };
 
+        auto first = static_cast<std::size_t>(std::lower_bound(timeData.begin(), timeData.end(), interaction.viewMin) - timeData.begin());
+        auto last = static_cast<std::size_t>(std::upper_bound(timeData.begin(), timeData.end(), interaction.viewMax) - timeData.begin());
+
         bool hasData = false;
         for (const auto& series : panel.series)
         {
-            auto count = std::min(timeData.size(), series.data.size());
-            for (std::size_t i = 0; i < count; ++i)
-            {
-                if (timeData[i] >= interaction.viewMin && timeData[i] <= interaction.viewMax)
-                {
-                    bounds.maxY = std::max(bounds.maxY, series.data[i]);
-                    bounds.minY = std::min(bounds.minY, series.data[i]);
-                    hasData = true;
-                }
-            }
+            auto end = std::min(last, series.data.size());
+            if (first >= end)
+                continue;
+
+            auto [minimum, maximum] = std::minmax_element(series.data.begin() + first, series.data.begin() + end);
+            bounds.minY = std::min(bounds.minY, *minimum);
+            bounds.maxY = std::max(bounds.maxY, *maximum);
+            hasData = true;
         }
 
         if (!hasData)
@@ -3,6 +3,9 @@
 #include "simulator/widgets/ChartInteraction.hpp"
 #include <QColor>
 #include <QMouseEvent>
+#include <QPixmap>
+#include <QPolygonF>
+#include <QSize>
 #include <QString>
 #include <QWheelEvent>
 #include <QWidget>
@@ -69,6 +72,7 @@ namespace simulator::widgets
         void DrawYLabels(QPainter& painter, const QRect& plotArea, const PanelBounds& bounds);
         void DrawLegend(QPainter& painter, const QRect& plotArea, const ChartPanel& panel);
         void DrawCrosshair(QPainter& painter);
+        void RenderChart();
         [[nodiscard]] PanelBounds ComputeBounds(const ChartPanel& panel) const;
         [[nodiscard]] std::vector<PanelLayout> ComputeLayouts() const;
         [[nodiscard]] float TimeToX(float t, int plotLeft, int plotWidth) const;
@@ -78,6 +82,13 @@ namespace simulator::widgets
         float maxTime = 0.0f;
         ChartInteraction interaction;
         std::vector<PanelLayout> cachedLayouts;
+        bool layoutsStale = true;
+        QSize layoutSize;
+        qreal layoutDevicePixelRatio = 0.0;
+        float layoutViewMin = 0.0f;
+        float layoutViewMax = 0.0f;
+        QPixmap chartPixmap;
+        QPolygonF polyline;
 
         static constexpr int leftMargin = 65;
         static constexpr int rightMargin = 20;